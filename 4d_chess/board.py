@@ -2,12 +2,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from itertools import product
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from .pieces import Piece
 
 Coordinate = Tuple[int, int, int, int]
 
+_INITIAL_CAPACITY = 16
+_ZOBRIST_CODES = 64
+_ZOBRIST_SEED = 0
+
 
 @dataclass
 class TransformationResult:
@@ -18,68 +25,285 @@ class TransformationResult:
 
 
 class Board4D:
-    """Model of a four-dimensional chess board."""
+    """Model of a four-dimensional chess board.
+
+    Piece placement is stored structure-of-arrays style: an ``(N, 4)``
+    coordinate matrix with a parallel list of piece objects, so that
+    whole-board transformations run as vectorized NumPy passes instead of
+    per-piece Python loops.
+    """
 
     def __init__(self, dimensions: Sequence[int]) -> None:
         if len(dimensions) != 4:
             raise ValueError("Board must have exactly four dimensions")
         self.dimensions: Tuple[int, int, int, int] = tuple(dimensions)  # type: ignore[assignment]
-        self._pieces: Dict[Coordinate, Piece] = {}
+        # Coordinates are packed as narrowly as the axis lengths allow so a
+        # cache line covers more pieces during vectorized transforms.
+        coord_dtype = np.int8 if max(self.dimensions) <= 127 else np.int16
+        self._coords = np.zeros((_INITIAL_CAPACITY, 4), dtype=coord_dtype)
+        self._count = 0
+        self._pieces_list: List[Piece] = []
+        self._piece_to_idx: Dict[int, int] = {}
+        cells = int(np.prod(self.dimensions))
+        self._zobrist = np.random.default_rng(_ZOBRIST_SEED).integers(
+            0, 2**63 - 1, size=(cells, _ZOBRIST_CODES), dtype=np.uint64
+        )
+        self._piece_codes: Dict[Tuple[str, int], int] = {}
+        self._hash = 0
+        # Lazily rebuilt glyph grid shared by repeat projections of the
+        # same position (see serialize_projection).
+        self._render_cache: Optional[np.ndarray] = None
+        # Shape-dependent move tables, keyed by the dimensions tuple so a
+        # transformation that keeps or revisits a shape (every reshape_axis,
+        # and any axis permutation of a cubic board) reuses them instead of
+        # rebuilding.  The reachable shapes are the permutations and divisor
+        # reshapes of the initial dimensions, so the dicts stay small.
+        self._cat_slip_offsets: Dict[Tuple[int, int, int, int], np.ndarray] = {}
+        self._leap_targets: Dict[
+            Tuple[Tuple[int, int, int, int], Tuple[Coordinate, ...]],
+            List[Tuple[np.ndarray, Tuple[Coordinate, ...]]],
+        ] = {}
+        self._configure_geometry()
+
+    def _configure_geometry(self) -> None:
+        """Recompute strides and the flat cell grid for the current dimensions."""
+
+        d0, d1, d2, d3 = self.dimensions
+        self._strides: Tuple[int, int, int, int] = (d1 * d2 * d3, d2 * d3, d3, 1)
+        self._strides_arr = np.asarray(self._strides, dtype=np.int64)
+        self._dims_arr = np.asarray(self.dimensions, dtype=np.int64)
+        self._grid: List[Optional[Piece]] = [None] * (d0 * d1 * d2 * d3)
+        # Signed occupant ids (Player.occupant_code, 0 = empty) mirrored
+        # alongside the object grid for numeric move-generation kernels.
+        self._occupants = np.zeros(d0 * d1 * d2 * d3, dtype=np.int32)
+        # Pieces parked outside the current dimensions by a transformation,
+        # keyed by their stored coordinate; they have no grid cell but stay
+        # addressable and may re-enter the board.
+        self._off_grid: Dict[Coordinate, Piece] = {}
+        self._render_cache = None
+
+    def _flat_keys(self, coords: np.ndarray) -> np.ndarray:
+        """Encode coordinate rows as scalar row-major cell keys."""
+
+        return coords.astype(np.int64) @ self._strides_arr
+
+    def _flat_index(self, position: Coordinate) -> int:
+        strides = self._strides
+        return position[0] * strides[0] + position[1] * strides[1] + position[2] * strides[2] + position[3]
+
+    def _cat_slip_table(self) -> np.ndarray:
+        """Distinct nonzero one- and two-axis slip offsets for the Cat.
+
+        The table depends only on the board shape, so it is built lazily
+        and kept per shape; a transformation back to a seen shape reuses it.
+        """
+
+        offsets = self._cat_slip_offsets.get(self.dimensions)
+        if offsets is None:
+            dims = self.dimensions
+            blocks: List[np.ndarray] = []
+            for axis_a in range(4):
+                for axis_b in range(axis_a + 1, 4):
+                    delta_a = np.arange(1 - dims[axis_a], dims[axis_a], dtype=np.int64)
+                    delta_b = np.arange(1 - dims[axis_b], dims[axis_b], dtype=np.int64)
+                    block = np.zeros((delta_a.size, delta_b.size, 4), dtype=np.int64)
+                    block[..., axis_a] = delta_a[:, None]
+                    block[..., axis_b] = delta_b[None, :]
+                    blocks.append(block.reshape(-1, 4))
+            stacked = np.concatenate(blocks)
+            # Single-axis slips appear under several axis pairs and the zero
+            # offset under all of them; dedupe once here.
+            stacked = stacked[(stacked != 0).any(axis=1)]
+            offsets = np.unique(stacked, axis=0)
+            self._cat_slip_offsets[self.dimensions] = offsets
+        return offsets
+
+    def _leap_table(self, offsets: Tuple[Coordinate, ...]) -> List[Tuple[np.ndarray, Tuple[Coordinate, ...]]]:
+        """Per-square in-bounds destinations for a leap offset table.
+
+        Keyed by the current dimensions plus the offsets' value: the former
+        keeps tables alive across transformations that keep or revisit a
+        shape, and the latter rather than id() because identities can be
+        reused after a custom table is garbage-collected, which would
+        silently serve the wrong destinations.  Entries pair the flat
+        destination indices with the decoded tuples.
+        """
+
+        key = (self.dimensions, offsets)
+        table = self._leap_targets.get(key)
+        if table is None:
+            cells = len(self._grid)
+            squares = np.stack(np.unravel_index(np.arange(cells), self.dimensions), axis=1)
+            deltas = np.asarray(offsets, dtype=np.int64)
+            targets = squares[:, None, :] + deltas[None, :, :]
+            in_bounds = ((targets >= 0) & (targets < self._dims_arr)).all(axis=2)
+            flat = targets @ self._strides_arr
+            table = []
+            for square in range(cells):
+                mask = in_bounds[square]
+                table.append(
+                    (flat[square][mask], tuple(map(tuple, targets[square][mask].tolist())))
+                )
+            self._leap_targets[key] = table
+        return table
+
+    @property
+    def zobrist(self) -> int:
+        """Incrementally maintained Zobrist hash of the current position."""
+
+        return self._hash
+
+    def _piece_code(self, piece: Piece) -> int:
+        key = (piece.short_name, piece.player.index)
+        code = self._piece_codes.get(key)
+        if code is None:
+            code = len(self._piece_codes)
+            if code >= _ZOBRIST_CODES:
+                raise ValueError("Too many distinct piece kinds for the Zobrist table")
+            self._piece_codes[key] = code
+        return code
+
+    def _toggle_hash(self, piece: Piece, position: Coordinate) -> None:
+        self._hash ^= int(self._zobrist[self._flat_index(position), self._piece_code(piece)])
+
+    def _rebuild_hash(self) -> None:
+        self._hash = 0
+        for piece in self._pieces_list:
+            position = piece.position
+            # A preserved piece parked off-grid by a transformation has no
+            # cell, so it cannot contribute to the occupancy hash.
+            if self.is_within_bounds(position):
+                self._toggle_hash(piece, position)
 
     def is_within_bounds(self, position: Coordinate) -> bool:
-        return all(0 <= coordinate < limit for coordinate, limit in zip(position, self.dimensions))
+        # Fully unrolled: no zip/all iterator machinery in this hot predicate.
+        d = self.dimensions
+        return (
+            0 <= position[0] < d[0]
+            and 0 <= position[1] < d[1]
+            and 0 <= position[2] < d[2]
+            and 0 <= position[3] < d[3]
+        )
+
+    def _append_row(self, position: Coordinate) -> int:
+        if self._count == len(self._coords):
+            grown = np.zeros((len(self._coords) * 2, 4), dtype=self._coords.dtype)
+            grown[: self._count] = self._coords[: self._count]
+            self._coords = grown
+        index = self._count
+        self._coords[index] = position
+        self._count += 1
+        return index
+
+    def _remove_row(self, index: int) -> Piece:
+        """Swap-remove row *index*, keeping the coordinate array dense."""
+
+        piece = self._pieces_list[index]
+        last = self._count - 1
+        if index != last:
+            moved = self._pieces_list[last]
+            self._coords[index] = self._coords[last]
+            self._pieces_list[index] = moved
+            self._piece_to_idx[id(moved)] = index
+            moved._row = index
+        self._pieces_list.pop()
+        del self._piece_to_idx[id(piece)]
+        self._count = last
+        return piece
 
     def place_piece(self, piece: Piece, position: Coordinate) -> None:
         if not self.is_within_bounds(position):
             raise ValueError(f"Position {position} is outside of the board")
-        if position in self._pieces:
+        flat = self._flat_index(position)
+        if self._grid[flat] is not None:
             raise ValueError(f"Position {position} already occupied")
-        self._pieces[position] = piece
-        piece.position = position
+        index = self._append_row(position)
+        self._pieces_list.append(piece)
+        self._piece_to_idx[id(piece)] = index
+        self._grid[flat] = piece
+        self._occupants[flat] = piece.player.occupant_code
+        self._toggle_hash(piece, position)
+        self._render_cache = None
+        piece._board = self
+        piece._row = index
 
     def remove_piece(self, position: Coordinate) -> Optional[Piece]:
-        piece = self._pieces.pop(position, None)
-        if piece is not None:
-            piece.position = None
-            piece.is_active = False
+        occupant = self.get_piece(position)
+        if occupant is None:
+            return None
+        piece = self._remove_row(self._piece_to_idx[id(occupant)])
+        if self.is_within_bounds(position):
+            flat = self._flat_index(position)
+            self._grid[flat] = None
+            self._occupants[flat] = 0
+            self._toggle_hash(piece, position)
+        else:
+            del self._off_grid[position]
+        self._render_cache = None
+        piece._board = None
+        piece._row = -1
+        piece.is_active = False
         return piece
 
     def move_piece(self, start: Coordinate, end: Coordinate) -> Optional[Piece]:
-        if start not in self._pieces:
+        piece = self.get_piece(start)
+        if piece is None:
             raise ValueError("No piece at start position")
-        piece = self._pieces[start]
-        captured = self._pieces.pop(end, None)
-        self._pieces.pop(start)
-        self._pieces[end] = piece
-        piece.position = end
+        captured = self.remove_piece(end)
+        index = self._piece_to_idx[id(piece)]
+        self._coords[index] = end
+        if self.is_within_bounds(start):
+            start_flat = self._flat_index(start)
+            self._grid[start_flat] = None
+            self._occupants[start_flat] = 0
+            self._toggle_hash(piece, start)
+        else:
+            # An off-grid piece re-entering the board vacates no cell.
+            del self._off_grid[start]
+        end_flat = self._flat_index(end)
+        self._grid[end_flat] = piece
+        self._occupants[end_flat] = piece.player.occupant_code
+        self._toggle_hash(piece, end)
+        self._render_cache = None
         piece.has_moved = True
-        if captured is not None:
-            captured.position = None
-            captured.is_active = False
         return captured
 
     def swap_with_cat(self, start: Coordinate, end: Coordinate, cat: Piece, target: Piece) -> None:
         """Special movement helper used when a cat scratches another piece."""
 
-        if self._pieces.get(start) is not cat:
+        if self.get_piece(start) is not cat:
             raise ValueError("Cat must occupy the start coordinate")
-        if self._pieces.get(end) is not target:
+        if self.get_piece(end) is not target:
             raise ValueError("Target must occupy the destination coordinate")
-        self._pieces[end] = cat
-        cat.position = end
+        cat_index = self._piece_to_idx[id(cat)]
+        target_index = self._piece_to_idx[id(target)]
+        self._coords[cat_index] = end
+        self._coords[target_index] = start
+        start_flat = self._flat_index(start)
+        end_flat = self._flat_index(end)
+        self._grid[start_flat] = target
+        self._grid[end_flat] = cat
+        self._occupants[start_flat] = target.player.occupant_code
+        self._occupants[end_flat] = cat.player.occupant_code
+        for moved, old, new in ((cat, start, end), (target, end, start)):
+            self._toggle_hash(moved, old)
+            self._toggle_hash(moved, new)
+        self._render_cache = None
         cat.has_moved = True
-        self._pieces[start] = target
-        target.position = start
         target.has_moved = True
 
     def get_piece(self, position: Coordinate) -> Optional[Piece]:
-        return self._pieces.get(position)
+        if not self.is_within_bounds(position):
+            return self._off_grid.get(position)
+        return self._grid[self._flat_index(position)]
 
     def pieces(self) -> Iterator[Tuple[Coordinate, Piece]]:
-        yield from self._pieces.items()
+        for piece in self._pieces_list:
+            if piece.position is not None:
+                yield piece.position, piece
 
     def locate_pieces(self, predicate: Callable[[Piece], bool]) -> List[Piece]:
-        return [piece for piece in self._pieces.values() if predicate(piece)]
+        return [piece for piece in self._pieces_list if predicate(piece)]
 
     def apply_transformation(self, mapping: Callable[[Coordinate], Coordinate], preserve: Piece) -> TransformationResult:
         """Apply a coordinate mapping to all pieces except *preserve*.
@@ -87,51 +311,108 @@ class Board4D:
         When two pieces map to the same coordinate they annihilate each other.
         """
 
-        updated: Dict[Coordinate, Piece] = {}
-        casualties: List[Piece] = []
-        preserve_position = preserve.position
-        for position, piece in list(self._pieces.items()):
+        coords = self._coords[: self._count]
+        # Accumulate in int64: a user-supplied mapper may return coordinates
+        # far outside the narrow SoA dtype, and those must become casualties
+        # rather than overflow errors.
+        new_coords = np.empty((self._count, 4), dtype=np.int64)
+        preserve_index: Optional[int] = None
+        for index, piece in enumerate(self._pieces_list):
             if piece is preserve:
-                updated[position] = piece
-                continue
-            new_position = mapping(position)
-            if not self.is_within_bounds(new_position):
-                casualties.append(piece)
-                self._pieces.pop(position)
-                piece.position = None
+                preserve_index = index
+                new_coords[index] = coords[index]
+            else:
+                new_coords[index] = mapping(piece.position)
+        return self._resolve_transformation(new_coords, preserve_index)
+
+    def _resolve_transformation(self, new_coords: np.ndarray, preserve_index: Optional[int]) -> TransformationResult:
+        """Vectorized bounds and collision resolution over the new coordinates."""
+
+        count = len(new_coords)
+        # Dimensions may have been permuted by the caller; refresh strides
+        # and the cell grid before encoding any flat keys.
+        self._configure_geometry()
+        if count == 0:
+            self._hash = 0
+            return TransformationResult({}, [])
+        # Widen to int64 so bounds, keys and collision handling are immune
+        # to the narrow SoA dtype; surviving rows are narrowed back below.
+        new_coords = np.ascontiguousarray(new_coords, dtype=np.int64)
+        # Unsigned wraparound folds the 0 <= c check into the c < limit
+        # compare: negative coordinates become huge unsigned values.
+        unsigned = new_coords.view(np.uint64)
+        dims_unsigned = np.asarray(self.dimensions, dtype=np.uint64)
+        in_bounds = (unsigned < dims_unsigned).all(axis=1)
+        keys = self._flat_keys(new_coords)
+        # Out-of-bounds pieces are casualties regardless; give them unique
+        # keys so they cannot annihilate an in-bounds piece by accident.
+        keys[~in_bounds] = -np.arange(1, count + 1)[~in_bounds]
+        _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+        collided = counts[inverse] > 1
+        survives = in_bounds & ~collided
+        off_grid: Optional[Piece] = None
+        if preserve_index is not None:
+            survives[preserve_index] = True
+            if not in_bounds[preserve_index]:
+                # The preserved piece kept its old coordinate, which does
+                # not exist under the permuted dimensions.  It survives (it
+                # is performing the operation) but sits off-grid at that
+                # coordinate — still addressable, and able to re-enter the
+                # board — rather than being written through a wrap-around
+                # flat index into a wrong cell.
+                off_grid = self._pieces_list[preserve_index]
+
+        survivors: Dict[Coordinate, Piece] = {}
+        casualties: List[Piece] = []
+        surviving_pieces: List[Piece] = []
+        surviving_rows: List[int] = []
+        for index, piece in enumerate(self._pieces_list):
+            if survives[index]:
+                position: Coordinate = tuple(int(value) for value in new_coords[index])  # type: ignore[assignment]
+                piece._row = len(surviving_pieces)
+                survivors[position] = piece
+                surviving_pieces.append(piece)
+                surviving_rows.append(index)
+            else:
+                piece._board = None
+                piece._row = -1
                 piece.is_active = False
-                continue
-            if preserve_position is not None and new_position == preserve_position:
                 casualties.append(piece)
-                self._pieces.pop(position, None)
-                piece.position = None
-                piece.is_active = False
-                continue
-            existing = updated.get(new_position)
-            if existing is not None and existing is not preserve:
-                casualties.extend([existing, piece])
-                updated.pop(new_position)
-                self._pieces.pop(position, None)
-                existing.position = None
-                existing.is_active = False
-                piece.position = None
-                piece.is_active = False
+
+        self._count = len(surviving_pieces)
+        # Reuse the existing capacity array instead of allocating a new one.
+        self._coords[: self._count] = new_coords[surviving_rows]
+        self._pieces_list = surviving_pieces
+        self._piece_to_idx = {id(piece): index for index, piece in enumerate(surviving_pieces)}
+        for piece in surviving_pieces:
+            if piece is off_grid:
+                self._off_grid[piece.position] = piece
                 continue
-            updated[new_position] = piece
-            self._pieces.pop(position, None)
-            piece.position = new_position
-        self._pieces = updated
-        return TransformationResult(updated, casualties)
+            flat = self._flat_index(piece.position)
+            self._grid[flat] = piece
+            self._occupants[flat] = piece.player.occupant_code
+        # Flat indices shift when dimensions change, so rebuild from scratch.
+        self._rebuild_hash()
+        return TransformationResult(survivors, casualties)
 
-    def transpose(self, order: Sequence[int], preserve: Piece) -> TransformationResult:
-        if sorted(order) != [0, 1, 2, 3]:
-            raise ValueError("Order must be a permutation of axes 0..3")
+    def _preserve_index(self, preserve: Piece) -> Optional[int]:
+        return self._piece_to_idx.get(id(preserve))
 
-        def mapper(position: Coordinate) -> Coordinate:
-            return tuple(position[index] for index in order)  # type: ignore[return-value]
+    def _apply_axis_permutation(self, order: Sequence[int], preserve: Piece) -> TransformationResult:
+        """Permute coordinate columns in one NumPy pass; *preserve* stays put."""
 
         self.dimensions = tuple(self.dimensions[index] for index in order)  # type: ignore[assignment]
-        return self.apply_transformation(mapper, preserve)
+        coords = self._coords[: self._count]
+        new_coords = coords[:, list(order)]
+        preserve_index = self._preserve_index(preserve)
+        if preserve_index is not None:
+            new_coords[preserve_index] = coords[preserve_index]
+        return self._resolve_transformation(new_coords, preserve_index)
+
+    def transpose(self, order: Sequence[int], preserve: Piece) -> TransformationResult:
+        if sorted(order) != [0, 1, 2, 3]:
+            raise ValueError("Order must be a permutation of axes 0..3")
+        return self._apply_axis_permutation(order, preserve)
 
     def swap_axes(self, axis_a: int, axis_b: int, preserve: Piece) -> TransformationResult:
         order = list(range(4))
@@ -142,12 +423,7 @@ class Board4D:
         order = list(range(4))
         axis = order.pop(source)
         order.insert(destination, axis)
-
-        def mapper(position: Coordinate) -> Coordinate:
-            return tuple(position[index] for index in order)  # type: ignore[return-value]
-
-        self.dimensions = tuple(self.dimensions[index] for index in order)  # type: ignore[assignment]
-        return self.apply_transformation(mapper, preserve)
+        return self._apply_axis_permutation(order, preserve)
 
     def reshape_axis(self, axis: int, new_size: int, preserve: Piece) -> TransformationResult:
         if new_size <= 0:
@@ -156,15 +432,14 @@ class Board4D:
         if old_size % new_size != 0:
             raise ValueError("New size must divide the old size")
         block = old_size // new_size
-
-        def mapper(position: Coordinate) -> Coordinate:
-            components = list(position)
-            value = components[axis]
-            new_value = (value % new_size) * block + (value // new_size)
-            components[axis] = new_value
-            return tuple(components)  # type: ignore[return-value]
-
-        return self.apply_transformation(mapper, preserve)
+        coords = self._coords[: self._count]
+        new_coords = coords.copy()
+        values = new_coords[:, axis]
+        new_coords[:, axis] = (values % new_size) * block + values // new_size
+        preserve_index = self._preserve_index(preserve)
+        if preserve_index is not None:
+            new_coords[preserve_index] = coords[preserve_index]
+        return self._resolve_transformation(new_coords, preserve_index)
 
     def serialize_projection(self, axis_order: Sequence[int] = (0, 1, 2, 3)) -> List[str]:
         """Return a textual representation of the board for CLI display."""
@@ -174,34 +449,28 @@ class Board4D:
         plane_axes = order[:2]
         depth_axes = order[2:]
         dims = [self.dimensions[idx] for idx in order]
-        for depth_coords in self._iter_depth_coordinates(depth_axes, dims[2:]):
-            header = "Depth " + ",".join(f"{axis}={value}" for axis, value in zip(depth_axes, depth_coords))
-            lines.append(header)
+        chars = self._render_cache
+        if chars is None:
+            chars = np.full(self.dimensions, ".", dtype="U1")
+            if self._count:
+                coords = self._coords[: self._count]
+                glyphs = np.array([piece._glyph for piece in self._pieces_list], dtype="U1")
+                # Skip pieces parked off-grid by a transformation.
+                on_grid = (
+                    (coords >= 0) & (coords < np.asarray(self.dimensions, dtype=np.int64))
+                ).all(axis=1)
+                if not on_grid.all():
+                    coords = coords[on_grid]
+                    glyphs = glyphs[on_grid]
+                chars[coords[:, 0], coords[:, 1], coords[:, 2], coords[:, 3]] = glyphs
+            self._render_cache = chars
+        # Axis 0 of the view is the column axis, axis 1 the row axis.
+        view = chars.transpose(order)
+        header_template = "Depth " + ",".join(f"{axis}={{}}" for axis in depth_axes)
+        for depth_coords in product(*(range(size) for size in dims[2:])):
+            lines.append(header_template.format(*depth_coords))
+            plane = view[(slice(None), slice(None)) + tuple(depth_coords)]
             for row in range(dims[1]):
-                row_cells: List[str] = []
-                for col in range(dims[0]):
-                    position_components = [0, 0, 0, 0]
-                    position_components[plane_axes[0]] = col
-                    position_components[plane_axes[1]] = row
-                    for axis, value in zip(depth_axes, depth_coords):
-                        position_components[axis] = value
-                    coord = tuple(position_components)  # type: ignore[assignment]
-                    piece = self.get_piece(coord)
-                    if piece is None:
-                        row_cells.append(".")
-                    else:
-                        row_cells.append(piece.short_name.lower() if piece.player.index % 2 else piece.short_name)
-                lines.append("".join(row_cells))
+                lines.append("".join(plane[:, row]))
             lines.append("")
         return lines
-
-    def _iter_depth_coordinates(self, axes: Sequence[int], dims: Sequence[int]) -> Iterable[Tuple[int, ...]]:
-        if not axes:
-            yield ()
-            return
-        axis = axes[0]
-        size = dims[0]
-        for value in range(size):
-            for remainder in self._iter_depth_coordinates(axes[1:], dims[1:]):
-                yield (value,) + remainder
-
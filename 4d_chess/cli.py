@@ -2,23 +2,91 @@
 from __future__ import annotations
 
 import argparse
+import re
 import sys
-from typing import Iterable, Sequence
+from typing import Iterable, Sequence, Tuple
 
 from .game import FourDChessGame
 
+_COORD_RE = re.compile(r"-?\d+")
 
-def parse_coordinate(text: str) -> Sequence[int]:
-    parts = text.replace("(", "").replace(")", "").split(",")
-    if len(parts) != 4:
+
+def parse_coordinate(text: str) -> Tuple[int, int, int, int]:
+    numbers = _COORD_RE.findall(text)
+    if len(numbers) != 4:
         raise ValueError("Coordinates must have four comma-separated values")
-    return [int(part.strip()) for part in parts]
+    return (int(numbers[0]), int(numbers[1]), int(numbers[2]), int(numbers[3]))
 
 
 def format_projection(lines: Iterable[str]) -> str:
     return "\n".join(lines)
 
 
+_HELP_TEXT = """
+Commands:
+  show                          Display a projection of the board.
+  status                        Display the current game status.
+  move x,y,z,w a,b,c,d          Move from start to end coordinate.
+  alien <op> [args]             Perform an alien layout operation. Examples:
+                                alien transpose 0 1 2 3
+                                alien swapaxis 0 2
+                                alien moveaxis 3 0
+                                alien reshapeaxis 0 4
+  help                          Show this message.
+  quit                          Exit the game.
+"""
+
+
+def _handle_help(game: FourDChessGame, args: Sequence[str]) -> bool:
+    if args:
+        return False
+    print(_HELP_TEXT)
+    return True
+
+
+def _handle_show(game: FourDChessGame, args: Sequence[str]) -> bool:
+    if args:
+        return False
+    print(format_projection(game.board.serialize_projection()))
+    return True
+
+
+def _handle_status(game: FourDChessGame, args: Sequence[str]) -> bool:
+    if args:
+        return False
+    print(game.status_report())
+    return True
+
+
+def _handle_move(game: FourDChessGame, args: Sequence[str]) -> bool:
+    if len(args) != 2:
+        return False
+    try:
+        game.move(parse_coordinate(args[0]), parse_coordinate(args[1]))
+    except Exception as exc:  # pragma: no cover - CLI convenience
+        print(f"Error: {exc}")
+    return True
+
+
+def _handle_alien(game: FourDChessGame, args: Sequence[str]) -> bool:
+    try:
+        op = args[0]
+        values = [int(value) for value in args[1:]]
+        game.perform_alien_operation(game.current_player, op, *values)
+    except Exception as exc:  # pragma: no cover - CLI convenience
+        print(f"Error: {exc}")
+    return True
+
+
+_HANDLERS = {
+    "help": _handle_help,
+    "show": _handle_show,
+    "status": _handle_status,
+    "move": _handle_move,
+    "alien": _handle_alien,
+}
+
+
 def run_game(players: int, dimensions: Sequence[int]) -> None:
     game = FourDChessGame(player_count=players, dimensions=dimensions)
     print("Welcome to 4D Chess! Type 'help' for a list of commands.")
@@ -33,48 +101,15 @@ def run_game(players: int, dimensions: Sequence[int]) -> None:
             break
         if not raw:
             continue
-        if raw.lower() in {"quit", "exit"}:
+        # Lowercase and tokenize exactly once per command line.
+        tokens = raw.lower().split()
+        command = tokens[0]
+        if command in {"quit", "exit"}:
             print("Exiting game.")
             break
-        if raw.lower() == "help":
-            print("""
-Commands:
-  show                          Display a projection of the board.
-  status                        Display the current game status.
-  move x,y,z,w a,b,c,d          Move from start to end coordinate.
-  alien <op> [args]             Perform an alien layout operation. Examples:
-                                alien transpose 0 1 2 3
-                                alien swapaxis 0 2
-                                alien moveaxis 3 0
-                                alien reshapeaxis 0 4
-  help                          Show this message.
-  quit                          Exit the game.
-""")
-            continue
-        if raw.lower() == "show":
-            print(format_projection(game.board.serialize_projection()))
-            continue
-        if raw.lower() == "status":
-            print(game.status_report())
-            continue
-        tokens = raw.split()
-        if tokens[0].lower() == "move" and len(tokens) == 3:
-            try:
-                start = tuple(parse_coordinate(tokens[1]))
-                end = tuple(parse_coordinate(tokens[2]))
-                game.move(start, end)
-            except Exception as exc:  # pragma: no cover - CLI convenience
-                print(f"Error: {exc}")
-            continue
-        if tokens[0].lower() == "alien":
-            try:
-                op = tokens[1]
-                args = [int(value) for value in tokens[2:]]
-                game.perform_alien_operation(game.current_player, op, *args)
-            except Exception as exc:  # pragma: no cover - CLI convenience
-                print(f"Error: {exc}")
-            continue
-        print("Unknown command. Type 'help' for assistance.")
+        handler = _HANDLERS.get(command)
+        if handler is None or not handler(game, tokens[1:]):
+            print("Unknown command. Type 'help' for assistance.")
 
 
 def main(argv: Sequence[str] | None = None) -> int:
@@ -1,9 +1,10 @@
 """Game orchestration for 4D chess."""
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import sys
+from typing import Callable, Collection, Dict, List, Optional, Sequence, Tuple
 
-from .board import Board4D, Coordinate
+from .board import Board4D, Coordinate, TransformationResult
 from .pieces import (
     Alien,
     Bishop,
@@ -17,6 +18,34 @@ from .pieces import (
 )
 from .player import Player, default_players
 
+# Size bound shared by the game's transposition tables; cleared wholesale
+# when full, matching the move cache in pieces.py.
+_CACHE_LIMIT = 4096
+
+# Alien operations: name -> (arity, arity error, board call).
+_ALIEN_OPS: Dict[str, Tuple[int, str, Callable[[Board4D, Alien, Tuple[int, ...]], TransformationResult]]] = {
+    "transpose": (
+        4,
+        "transpose requires four axis indices",
+        lambda board, alien, args: board.transpose(args, alien),
+    ),
+    "swapaxis": (
+        2,
+        "swapaxis requires two axis indices",
+        lambda board, alien, args: board.swap_axes(args[0], args[1], alien),
+    ),
+    "moveaxis": (
+        2,
+        "moveaxis requires source and destination",
+        lambda board, alien, args: board.move_axis(args[0], args[1], alien),
+    ),
+    "reshapeaxis": (
+        2,
+        "reshapeaxis requires axis and new size",
+        lambda board, alien, args: board.reshape_axis(args[0], args[1], alien),
+    ),
+}
+
 
 class FourDChessGame:
     """Coordinate the 4D chess gameplay including turns and rules."""
@@ -29,6 +58,12 @@ class FourDChessGame:
         self.turn_index: int = 0
         self.winner: Optional[Player] = None
         self._player_pieces: Dict[Player, List[Piece]] = {player: [] for player in self.players}
+        self._active_pieces: Dict[Player, List[Piece]] = {player: [] for player in self.players}
+        self._kings: Dict[Player, Piece] = {}
+        self._aliens: Dict[Player, Alien] = {}
+        self._legal_cache: Dict[Tuple[int, Coordinate], Collection[Coordinate]] = {}
+        self._tt: Dict[Tuple[int, Coordinate, int, bool], List[Coordinate]] = {}
+        self._winner_tt: Dict[int, Optional[Player]] = {}
         self._setup_initial_positions()
 
     @property
@@ -84,13 +119,79 @@ class FourDChessGame:
 
     def _register_piece(self, piece: Piece, position: Coordinate) -> None:
         self.board.place_piece(piece, position)
-        self._player_pieces[piece.player].append(piece)
+        roster = self._player_pieces[piece.player]
+        piece._roster_index = len(roster)
+        roster.append(piece)
+        active = self._active_pieces[piece.player]
+        piece._active_index = len(active)
+        active.append(piece)
+        if isinstance(piece, King):
+            self._kings[piece.player] = piece
+        elif isinstance(piece, Alien):
+            self._aliens[piece.player] = piece
+
+    def _roster_discard(self, piece: Piece) -> None:
+        """Remove a piece from its player's roster in O(1) via swap-remove."""
+
+        roster = self._player_pieces.get(piece.player)
+        if roster is None:
+            return
+        index = piece._roster_index
+        if 0 <= index < len(roster) and roster[index] is piece:
+            last = roster[-1]
+            roster[index] = last
+            last._roster_index = index
+            roster.pop()
+            piece._roster_index = -1
+        elif piece in roster:  # stale slot: the roster was mutated directly
+            roster.remove(piece)
+        self._active_discard(piece)
+
+    def _active_discard(self, piece: Piece) -> None:
+        active = self._active_pieces.get(piece.player)
+        if active is None:
+            return
+        index = piece._active_index
+        if 0 <= index < len(active) and active[index] is piece:
+            last = active[-1]
+            active[index] = last
+            last._active_index = index
+            active.pop()
+            piece._active_index = -1
+
+    def _piece_current(self, piece: Piece) -> bool:
+        """Check that a cached piece is still alive on the current board."""
+
+        if not piece.is_active:
+            return False
+        position = piece.position
+        return position is not None and self.board.get_piece(position) is piece
+
+    def _cached_legal_moves(self, piece: Piece) -> Collection[Coordinate]:
+        """Compute a piece's move set at most once per ply."""
+
+        key = (id(piece), piece.position)
+        moves = self._legal_cache.get(key)
+        if moves is None:
+            moves = piece.legal_moves(self.board)
+            self._legal_cache[key] = moves
+        return moves
 
     def legal_moves_from(self, position: Coordinate) -> List[Coordinate]:
         piece = self.board.get_piece(position)
         if piece is None:
             return []
-        return sorted(piece.legal_moves(self.board))
+        # The Zobrist hash only sees occupancy, so the movement object and
+        # has_moved flag must discriminate the key: a Cat scratch swaps a
+        # piece's movement without changing the hash.
+        key = (self.board.zobrist, position, id(piece._movement), piece.has_moved)
+        moves = self._tt.get(key)
+        if moves is None:
+            moves = sorted(self._cached_legal_moves(piece))
+            if len(self._tt) >= _CACHE_LIMIT:
+                self._tt.clear()
+            self._tt[key] = moves
+        return list(moves)
 
     def move(self, start: Coordinate, end: Coordinate) -> None:
         if self.winner is not None:
@@ -100,37 +201,56 @@ class FourDChessGame:
             raise ValueError("No piece at starting coordinate")
         if piece.player is not self.current_player:
             raise ValueError("It is not this player's turn")
-        legal = piece.legal_moves(self.board)
+        legal = self._cached_legal_moves(piece)
         if end not in legal:
             raise ValueError("Illegal move for the selected piece")
         destination_piece = self.board.get_piece(end)
-        if isinstance(piece, Cat) and destination_piece is not None and destination_piece.player != piece.player:
+        if isinstance(piece, Cat) and destination_piece is not None and destination_piece.player is not piece.player:
             piece.scratch(destination_piece)
             self.board.swap_with_cat(start, end, piece, destination_piece)
         else:
             captured = self.board.move_piece(start, end)
             if captured is not None:
-                self._player_pieces[captured.player].remove(captured)
+                self._roster_discard(captured)
         self._advance_turn()
         self._update_winner()
 
     def _advance_turn(self) -> None:
         self.turn_index = (self.turn_index + 1) % len(self.players)
+        self._legal_cache.clear()
 
     def _update_winner(self) -> None:
-        alive_players = [player for player in self.players if self._king_alive(player)]
-        if len(alive_players) == 1:
-            self.winner = alive_players[0]
+        key = self.board.zobrist
+        if key in self._winner_tt:
+            winner = self._winner_tt[key]
+        else:
+            alive_players = [player for player in self.players if self._king_alive(player)]
+            winner = alive_players[0] if len(alive_players) == 1 else None
+            if len(self._winner_tt) >= _CACHE_LIMIT:
+                self._winner_tt.clear()
+            self._winner_tt[key] = winner
+        if winner is not None:
+            self.winner = winner
 
     def _king_alive(self, player: Player) -> bool:
+        king = self._kings.get(player)
+        if king is not None and self._piece_current(king):
+            return True
+        # Cache miss or stale reference (e.g. the board was replaced);
+        # fall back to the roster scan and refresh the cache.
         for piece in self._player_pieces[player]:
             if isinstance(piece, King) and piece.is_active:
+                self._kings[player] = piece
                 return True
         return False
 
     def find_alien(self, player: Player) -> Alien:
+        alien = self._aliens.get(player)
+        if alien is not None and self._piece_current(alien):
+            return alien
         for piece in self._player_pieces[player]:
             if isinstance(piece, Alien) and piece.is_active:
+                self._aliens[player] = piece
                 return piece
         raise ValueError("Player does not have an active Alien")
 
@@ -138,30 +258,34 @@ class FourDChessGame:
         if self.current_player is not player:
             raise ValueError("It is not this player's turn")
         alien = self.find_alien(player)
-        operation = operation.lower()
-        if operation == "transpose":
-            if len(args) != 4:
-                raise ValueError("transpose requires four axis indices")
-            self.board.transpose(args, alien)
-        elif operation == "swapaxis":
-            if len(args) != 2:
-                raise ValueError("swapaxis requires two axis indices")
-            self.board.swap_axes(args[0], args[1], alien)
-        elif operation == "moveaxis":
-            if len(args) != 2:
-                raise ValueError("moveaxis requires source and destination")
-            self.board.move_axis(args[0], args[1], alien)
-        elif operation == "reshapeaxis":
-            if len(args) != 2:
-                raise ValueError("reshapeaxis requires axis and new size")
-            self.board.reshape_axis(args[0], args[1], alien)
-        else:
+        operation = sys.intern(operation.lower())
+        entry = _ALIEN_OPS.get(operation)
+        if entry is None:
             raise ValueError(f"Unknown alien operation: {operation}")
+        arity, arity_error, apply_op = entry
+        if len(args) != arity:
+            raise ValueError(arity_error)
+        result = apply_op(self.board, alien, args)
+        for casualty in result.casualties:
+            self._roster_discard(casualty)
         self._advance_turn()
         self._update_winner()
 
-    def pieces_for_player(self, player: Player) -> Iterable[Piece]:
-        return [piece for piece in self._player_pieces[player] if piece.is_active]
+    def pieces_for_player(self, player: Player) -> List[Piece]:
+        """Return the player's active pieces as a fresh list.
+
+        Pieces can be deactivated at the board level without going through
+        the game (remove_piece flips is_active directly), so stale entries
+        are compacted out of the roster on read.
+        """
+
+        active = self._active_pieces[player]
+        if not all(piece.is_active for piece in active):
+            active = [piece for piece in active if piece.is_active]
+            for index, piece in enumerate(active):
+                piece._active_index = index
+            self._active_pieces[player] = active
+        return list(active)
 
     def status_report(self) -> str:
         report_lines = [f"Turn: {self.current_player.identifier}"]
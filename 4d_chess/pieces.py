@@ -1,7 +1,10 @@
 """Piece definitions for 4D Chess."""
 from __future__ import annotations
 
-from typing import List, Optional, Sequence, Set, Tuple, TYPE_CHECKING
+from itertools import permutations
+from typing import Collection, List, Optional, Sequence, Set, Tuple, TYPE_CHECKING
+
+import numpy as np
 
 if TYPE_CHECKING:  # pragma: no cover - imported only for type checking
     from .board import Board4D
@@ -9,186 +12,393 @@ if TYPE_CHECKING:  # pragma: no cover - imported only for type checking
 
 Coordinate = Tuple[int, int, int, int]
 
+# All 24 index permutations of the four axes, for the Cat's dimension hop.
+_S4_PERMS: Tuple[Tuple[int, int, int, int], ...] = tuple(permutations(range(4)))  # type: ignore[assignment]
+
+# Transposition table for Piece.legal_moves, keyed by piece identity,
+# movement identity, has_moved and the board's Zobrist hash.  Cleared
+# wholesale when full rather than tracking LRU order.
+_MOVE_CACHE: dict = {}
+_MOVE_CACHE_LIMIT = 4096
+
+try:  # pragma: no cover - optional accelerator
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    njit = None
+
+if njit is not None:  # pragma: no cover - exercised only with numba installed
+
+    @njit(cache=True)
+    def _ray_walk_kernel(occ_flat, strides, dims, start, dirs, max_dist, my_code, out):
+        """Walk every slide ray natively; write destinations into *out*.
+
+        Returns the number of rows written.  Bounds check, occupant gather
+        and blocker logic all run as compiled code with no Python objects.
+        """
+
+        n = 0
+        for d in range(dirs.shape[0]):
+            x0, x1, x2, x3 = start[0], start[1], start[2], start[3]
+            for _ in range(max_dist):
+                x0 += dirs[d, 0]
+                x1 += dirs[d, 1]
+                x2 += dirs[d, 2]
+                x3 += dirs[d, 3]
+                if (
+                    x0 < 0 or x0 >= dims[0]
+                    or x1 < 0 or x1 >= dims[1]
+                    or x2 < 0 or x2 >= dims[2]
+                    or x3 < 0 or x3 >= dims[3]
+                ):
+                    break
+                occ = occ_flat[x0 * strides[0] + x1 * strides[1] + x2 * strides[2] + x3]
+                # Two independent single-compare predicates (emit unless own
+                # piece; stop on any piece) rather than a three-way branch,
+                # which LLVM lowers to selects instead of jumps.
+                if occ != my_code:
+                    out[n, 0] = x0
+                    out[n, 1] = x1
+                    out[n, 2] = x2
+                    out[n, 3] = x3
+                    n += 1
+                if occ != 0:
+                    break
+        return n
+
+    # Warm-up compile at import so the first real move generation does not
+    # pay the JIT cost.
+    _ray_walk_kernel(
+        np.zeros(1, dtype=np.int32),
+        np.ones(4, dtype=np.int64),
+        np.ones(4, dtype=np.int64),
+        np.zeros(4, dtype=np.int64),
+        np.zeros((1, 4), dtype=np.int8),
+        0,
+        1,
+        np.empty((1, 4), dtype=np.int64),
+    )
+else:
+    _ray_walk_kernel = None
+
 
 class MovementPattern:
     """Strategy object describing how a piece can move on the board."""
 
-    def legal_moves(self, board: "Board4D", piece: "Piece", position: Coordinate) -> Set[Coordinate]:
-        """Return the set of legal destination coordinates for the piece.
+    __slots__ = ()
 
-        Subclasses must implement this method.
+    def legal_moves(self, board: "Board4D", piece: "Piece", position: Coordinate) -> Collection[Coordinate]:
+        """Return the legal destination coordinates for the piece.
+
+        Subclasses must implement this method.  Patterns that generate each
+        destination at most once return a plain tuple; only patterns that can
+        produce duplicates (the Cat) pay for a set.
         """
 
         raise NotImplementedError
 
 
+# Movement tags indexing the module-level _DISPATCH table below.
+_MV_SLIDE = 0
+_MV_LEAP = 1
+_MV_PAWN = 2
+_MV_CAT = 3
+
+
 class SlidingMovement(MovementPattern):
-    """Movement pattern for pieces that slide along a set of directions."""
+    """Movement pattern for pieces that slide along a set of directions.
+
+    All rays are traversed at once as a broadcast ``(directions, steps, 4)``
+    coordinate block gathered against the board's flat occupant array, so no
+    per-step Python loop or tuple allocation occurs.
+    """
+
+    __slots__ = ("directions", "max_distance", "_dirs_arr")
+
+    _tag = _MV_SLIDE
 
     def __init__(self, directions: Sequence[Coordinate], max_distance: Optional[int] = None) -> None:
         self.directions = directions
         self.max_distance = max_distance
-
-    def legal_moves(self, board: "Board4D", piece: "Piece", position: Coordinate) -> Set[Coordinate]:
-        moves: Set[Coordinate] = set()
-        for direction in self.directions:
-            current = position
-            distance = 0
-            while True:
-                distance += 1
-                if self.max_distance is not None and distance > self.max_distance:
-                    break
-                current = tuple(coord + step for coord, step in zip(current, direction))  # type: ignore[arg-type]
-                if not board.is_within_bounds(current):
-                    break
-                occupant = board.get_piece(current)
-                if occupant is None:
-                    moves.add(current)
-                    continue
-                if occupant.player != piece.player:
-                    moves.add(current)
-                break
-        return moves
+        self._dirs_arr = np.asarray(directions, dtype=np.int8)
+
+    def legal_moves(self, board: "Board4D", piece: "Piece", position: Coordinate) -> Tuple[Coordinate, ...]:
+        dims = board._dims_arr
+        max_steps = int(dims.max()) - 1 if self.max_distance is None else self.max_distance
+        if max_steps <= 0:
+            return ()
+        my_code = piece.player.occupant_code
+        if _ray_walk_kernel is not None:  # pragma: no cover - optional accelerator
+            out = np.empty((len(self._dirs_arr) * max_steps, 4), dtype=np.int64)
+            written = _ray_walk_kernel(
+                board._occupants,
+                board._strides_arr,
+                dims,
+                np.asarray(position, dtype=np.int64),
+                self._dirs_arr,
+                max_steps,
+                my_code,
+                out,
+            )
+            return tuple(map(tuple, out[:written].tolist()))
+        steps = np.arange(1, max_steps + 1, dtype=np.int64)
+        rays = np.asarray(position, dtype=np.int64) + self._dirs_arr[:, None, :] * steps[None, :, None]
+        in_bounds = ((rays >= 0) & (rays < dims)).all(axis=2)
+        flat = rays @ board._strides_arr
+        occupants = np.zeros(flat.shape, dtype=np.int32)
+        occupants[in_bounds] = board._occupants[flat[in_bounds]]
+        # Per ray: empty squares up to the first blocker, plus the blocker
+        # itself when it holds an enemy piece.
+        blocked = (occupants != 0) | ~in_bounds
+        first_block = np.where(blocked.any(axis=1), blocked.argmax(axis=1), max_steps)
+        step_index = np.arange(max_steps)
+        open_mask = step_index < first_block[:, None]
+        capture_mask = (step_index == first_block[:, None]) & in_bounds & (occupants != 0) & (occupants != my_code)
+        selected = rays[open_mask | capture_mask]
+        # Each (direction, step) pair is visited once, so the result is
+        # duplicate-free by construction.
+        return tuple(map(tuple, selected.tolist()))
 
 
 class KnightMovement(MovementPattern):
     """Movement pattern describing the 4D knight."""
 
-    def __init__(self, offsets: Sequence[Coordinate]) -> None:
-        self.offsets = offsets
+    __slots__ = ("offsets", "_offsets_arr")
 
-    def legal_moves(self, board: "Board4D", piece: "Piece", position: Coordinate) -> Set[Coordinate]:
-        moves: Set[Coordinate] = set()
-        for offset in self.offsets:
-            target = tuple(coord + step for coord, step in zip(position, offset))  # type: ignore[arg-type]
-            if not board.is_within_bounds(target):
-                continue
-            occupant = board.get_piece(target)
-            if occupant is None or occupant.player != piece.player:
-                moves.add(target)
-        return moves
+    _tag = _MV_LEAP
+
+    def __init__(self, offsets: Sequence[Coordinate]) -> None:
+        # Normalized so the board can key its per-square destination cache
+        # by value.
+        self.offsets: Tuple[Coordinate, ...] = tuple(offsets)
+        self._offsets_arr = np.asarray(self.offsets, dtype=np.int64)
+
+    def legal_moves(self, board: "Board4D", piece: "Piece", position: Coordinate) -> Tuple[Coordinate, ...]:
+        if not board.is_within_bounds(position):
+            # Parked off-grid by a transformation: no cached table covers
+            # this square, so take the bounds-checked path over the raw
+            # offsets to find the in-bounds re-entries.
+            targets = np.asarray(position, dtype=np.int64) + self._offsets_arr
+            targets = targets[((targets >= 0) & (targets < board._dims_arr)).all(axis=1)]
+            occupants = board._occupants[targets @ board._strides_arr]
+            return tuple(map(tuple, targets[occupants != piece.player.occupant_code].tolist()))
+        # The board caches the in-bounds destinations per square for this
+        # shared offset table, so move generation is an occupant gather and
+        # ownership mask with no offset arithmetic or bounds checks.
+        flat, coords = board._leap_table(self.offsets)[board._flat_index(position)]
+        keep = np.flatnonzero(board._occupants[flat] != piece.player.occupant_code)
+        if len(keep) == len(coords):
+            return coords
+        return tuple(coords[index] for index in keep.tolist())
 
 
 class PawnMovement(MovementPattern):
     """Movement pattern for 4D pawns."""
 
+    __slots__ = ("forward_axis", "forward_direction", "_forward_step", "_capture_steps")
+
+    _tag = _MV_PAWN
+
     def __init__(self, forward_axis: int, forward_direction: int) -> None:
         self.forward_axis = forward_axis
         self.forward_direction = forward_direction
-
-    def legal_moves(self, board: "Board4D", piece: "Piece", position: Coordinate) -> Set[Coordinate]:
-        moves: Set[Coordinate] = set()
-        axis = self.forward_axis
-        direction = self.forward_direction
-        forward_step = list(position)
-        forward_step[axis] += direction
-        forward_coord: Coordinate = tuple(forward_step)  # type: ignore[assignment]
-        if board.is_within_bounds(forward_coord) and board.get_piece(forward_coord) is None:
-            moves.add(forward_coord)
-            if not piece.has_moved:
-                double_step = list(forward_coord)
-                double_step[axis] += direction
-                double_coord: Coordinate = tuple(double_step)  # type: ignore[assignment]
-                if board.is_within_bounds(double_coord) and board.get_piece(double_coord) is None:
-                    moves.add(double_coord)
-        # captures: diagonally forward in any of the remaining axes
+        # The axis and direction never change after construction, so the
+        # forward and the six diagonal capture offsets are fixed 4-tuples;
+        # legal_moves only adds them, never splices.
+        step = [0, 0, 0, 0]
+        step[forward_axis] = forward_direction
+        self._forward_step: Coordinate = tuple(step)  # type: ignore[assignment]
+        captures: List[Coordinate] = []
         for capture_axis in range(4):
-            if capture_axis == axis:
+            if capture_axis == forward_axis:
                 continue
             for capture_direction in (-1, 1):
-                capture_step = list(position)
-                capture_step[axis] += direction
-                capture_step[capture_axis] += capture_direction
-                capture_coord: Coordinate = tuple(capture_step)  # type: ignore[assignment]
-                if not board.is_within_bounds(capture_coord):
-                    continue
-                occupant = board.get_piece(capture_coord)
-                if occupant is not None and occupant.player != piece.player:
-                    moves.add(capture_coord)
-        return moves
+                diagonal = list(step)
+                diagonal[capture_axis] = capture_direction
+                captures.append(tuple(diagonal))  # type: ignore[arg-type]
+        self._capture_steps: Tuple[Coordinate, ...] = tuple(captures)
+
+    def legal_moves(self, board: "Board4D", piece: "Piece", position: Coordinate) -> Tuple[Coordinate, ...]:
+        moves: List[Coordinate] = []
+        p0, p1, p2, p3 = position
+        f0, f1, f2, f3 = self._forward_step
+        forward_coord = (p0 + f0, p1 + f1, p2 + f2, p3 + f3)
+        occupants = board._occupants
+        in_bounds = board.is_within_bounds
+        flat_index = board._flat_index
+        my_code = piece.player.occupant_code
+        if in_bounds(forward_coord) and occupants[flat_index(forward_coord)] == 0:
+            moves.append(forward_coord)
+            if not piece.has_moved:
+                double_coord = (
+                    forward_coord[0] + f0,
+                    forward_coord[1] + f1,
+                    forward_coord[2] + f2,
+                    forward_coord[3] + f3,
+                )
+                if in_bounds(double_coord) and occupants[flat_index(double_coord)] == 0:
+                    moves.append(double_coord)
+        # captures: diagonally forward in any of the remaining axes
+        for offset in self._capture_steps:
+            capture_coord = (p0 + offset[0], p1 + offset[1], p2 + offset[2], p3 + offset[3])
+            if not in_bounds(capture_coord):
+                continue
+            occ = occupants[flat_index(capture_coord)]
+            if occ != 0 and occ != my_code:
+                moves.append(capture_coord)
+        return tuple(moves)
 
 
 class CatMovement(MovementPattern):
     """Movement pattern for the Cat piece."""
 
+    __slots__ = ()
+
+    _tag = _MV_CAT
+
     def legal_moves(self, board: "Board4D", piece: "Piece", position: Coordinate) -> Set[Coordinate]:
         moves: Set[Coordinate] = set()
-        # Dimension hop: permutations of coordinates
-        seen: Set[Coordinate] = set()
-        coords = list(position)
-        def permute(current: List[int], idx: int) -> None:
-            if idx == len(current):
-                permuted = tuple(current)
-                if permuted != position and permuted not in seen and board.is_within_bounds(permuted):
-                    occupant = board.get_piece(permuted)
-                    if occupant is None or occupant.player != piece.player:
-                        moves.add(permuted)
-                    seen.add(permuted)
-                return
-            for swap_idx in range(idx, len(current)):
-                current[idx], current[swap_idx] = current[swap_idx], current[idx]
-                permute(current, idx + 1)
-                current[idx], current[swap_idx] = current[swap_idx], current[idx]
-        permute(coords.copy(), 0)
-        # Linear slip: change along up to two axes in a single leap
-        for axis_a in range(4):
-            for axis_b in range(axis_a, 4):
-                for delta_a in range(-board.dimensions[axis_a] + 1, board.dimensions[axis_a]):
-                    for delta_b in range(-board.dimensions[axis_b] + 1, board.dimensions[axis_b]):
-                        if delta_a == 0 and delta_b == 0:
-                            continue
-                        if axis_a == axis_b and delta_b != 0:
-                            continue  # handled by delta_a already
-                        offset = [0, 0, 0, 0]
-                        offset[axis_a] = delta_a
-                        if axis_b != axis_a:
-                            offset[axis_b] = delta_b
-                        target = tuple(coord + step for coord, step in zip(position, offset))  # type: ignore[arg-type]
-                        if not board.is_within_bounds(target):
-                            continue
-                        occupant = board.get_piece(target)
-                        if occupant is None or occupant.player != piece.player:
-                            moves.add(target)
+        # Dimension hop: permutations of coordinates.  On a cubic board any
+        # permutation of an in-bounds coordinate stays in bounds.  A single
+        # set comprehension dedupes the 24 permutations in one C-level pass
+        # instead of interpreted add-or-skip bookkeeping.
+        cubic = len(set(board.dimensions)) == 1
+        hops = {
+            (position[perm[0]], position[perm[1]], position[perm[2]], position[perm[3]])
+            for perm in _S4_PERMS
+        } - {position}
+        in_bounds = board.is_within_bounds
+        flat_index = board._flat_index
+        occupants = board._occupants
+        my_code = piece.player.occupant_code
+        for permuted in hops:
+            if cubic or in_bounds(permuted):
+                if occupants[flat_index(permuted)] != my_code:
+                    moves.add(permuted)
+        # Linear slip: change along up to two axes in a single leap.  The
+        # offset table depends only on the board shape and is cached there,
+        # so each call is a single add, bounds filter and occupant gather.
+        dims = board._dims_arr
+        my_code = piece.player.occupant_code
+        targets = np.asarray(position, dtype=np.int64) + board._cat_slip_table()
+        targets = targets[((targets >= 0) & (targets < dims)).all(axis=1)]
+        occupants = board._occupants[targets @ board._strides_arr]
+        moves.update(map(tuple, targets[occupants != my_code].tolist()))
         return moves
 
 
-class KingMovement(SlidingMovement):
-    """King movement limited to distance one in any direction."""
+# Plain-function dispatch indexed by the movement tag: a tuple subscript
+# plus direct call is cheaper than per-piece bound-method lookup in the
+# move-generation loop.
+_DISPATCH = (
+    SlidingMovement.legal_moves,
+    KnightMovement.legal_moves,
+    PawnMovement.legal_moves,
+    CatMovement.legal_moves,
+)
+
 
-    def __init__(self) -> None:
-        directions = []
-        for dx in (-1, 0, 1):
-            for dy in (-1, 0, 1):
-                for dz in (-1, 0, 1):
-                    for dw in (-1, 0, 1):
-                        if dx == dy == dz == dw == 0:
-                            continue
-                        directions.append((dx, dy, dz, dw))
-        super().__init__(directions, max_distance=1)
+def _build_knight_offsets() -> Tuple[Coordinate, ...]:
+    offsets: List[Coordinate] = []
+    for long_axis in range(4):
+        for short_axis in range(4):
+            if short_axis == long_axis:
+                continue
+            for long_step in (-2, 2):
+                for short_step in (-1, 1):
+                    vector = [0, 0, 0, 0]
+                    vector[long_axis] = long_step
+                    vector[short_axis] = short_step
+                    offsets.append(tuple(vector))  # type: ignore[arg-type]
+    return tuple(offsets)
+
+
+# Shared direction/offset tables, built once at import.  Everything except
+# the knight derives from the 80 nonzero unit directions: rook rays move one
+# axis, bishop rays move all four, and queen and king cover the full set.
+_ALL_DIRS_4D: Tuple[Coordinate, ...] = tuple(
+    (dx, dy, dz, dw)
+    for dx in (-1, 0, 1)
+    for dy in (-1, 0, 1)
+    for dz in (-1, 0, 1)
+    for dw in (-1, 0, 1)
+    if (dx, dy, dz, dw) != (0, 0, 0, 0)
+)
+_ROOK_DIRS = tuple(d for d in _ALL_DIRS_4D if abs(d[0]) + abs(d[1]) + abs(d[2]) + abs(d[3]) == 1)
+_BISHOP_DIRS = tuple(d for d in _ALL_DIRS_4D if 0 not in d)
+_KING_DIRS = _ALL_DIRS_4D
+_QUEEN_DIRS = _ALL_DIRS_4D
+_KNIGHT_OFFSETS = _build_knight_offsets()
 
 
 class Piece:
     """Base class for any piece placed on the board."""
 
+    __slots__ = (
+        "player",
+        "_movement",
+        "_board",
+        "_row",
+        "_roster_index",
+        "_active_index",
+        "_mv_tag",
+        "has_moved",
+        "is_active",
+        "_glyph",
+    )
+
     name: str = "Piece"
     short_name: str = "?"
 
     def __init__(self, player: "Player", movement: MovementPattern) -> None:
         self.player = player
         self._movement = movement
-        self.position: Optional[Coordinate] = None
+        self._mv_tag = movement._tag
+        # Set by Board4D while the piece is on a board; the coordinate
+        # itself lives in the board's SoA row, not on the piece.
+        self._board: Optional["Board4D"] = None
+        self._row: int = -1
+        # Slots in the owning game's per-player rosters, for O(1) swap-remove.
+        self._roster_index: int = -1
+        self._active_index: int = -1
         self.has_moved: bool = False
         self.is_active: bool = True
-
-    def legal_moves(self, board: "Board4D") -> Set[Coordinate]:
-        if self.position is None:
-            return set()
-        return self._movement.legal_moves(board, self, self.position)
+        # Display glyph, lowercased for odd players; computed once here so
+        # rendering never calls str.lower per cell.
+        self._glyph: str = self.short_name.lower() if player.index & 1 else self.short_name
+
+    @property
+    def position(self) -> Optional[Coordinate]:
+        """Current coordinate, read from the owning board's SoA row."""
+
+        board = self._board
+        if board is None:
+            return None
+        row = board._coords[self._row]
+        return (int(row[0]), int(row[1]), int(row[2]), int(row[3]))
+
+    def legal_moves(self, board: "Board4D") -> Collection[Coordinate]:
+        position = self.position
+        if position is None:
+            return ()
+        # Transposition cache: search re-enters the same position through
+        # many move orders, and the Zobrist hash identifies it regardless of
+        # path.  The movement object and has_moved flag are part of the key
+        # because a Cat scratch or a pawn's first step changes the move set
+        # without changing the occupancy hash.
+        key = (id(self), id(self._movement), self.has_moved, board.zobrist, position)
+        moves = _MOVE_CACHE.get(key)
+        if moves is None:
+            moves = _DISPATCH[self._mv_tag](self._movement, board, self, position)
+            if len(_MOVE_CACHE) >= _MOVE_CACHE_LIMIT:
+                _MOVE_CACHE.clear()
+            _MOVE_CACHE[key] = moves
+        return moves
 
     def set_movement(self, movement: MovementPattern) -> None:
         """Replace the movement strategy used by the piece."""
 
         self._movement = movement
+        self._mv_tag = movement._tag
 
     def describe(self) -> str:
         return f"{self.player.identifier} {self.name}"
@@ -201,89 +411,58 @@ class Rook(Piece):
     name = "Rook"
     short_name = "R"
 
+    __slots__ = ()
+
     def __init__(self, player: "Player") -> None:
-        directions: List[Coordinate] = []
-        for axis in range(4):
-            for sign in (-1, 1):
-                step = [0, 0, 0, 0]
-                step[axis] = sign
-                directions.append(tuple(step))
-        super().__init__(player, SlidingMovement(directions))
+        super().__init__(player, SlidingMovement(_ROOK_DIRS))
 
 
 class Bishop(Piece):
     name = "Bishop"
     short_name = "B"
 
+    __slots__ = ()
+
     def __init__(self, player: "Player") -> None:
-        directions: List[Coordinate] = []
-        for dx in (-1, 1):
-            for dy in (-1, 1):
-                for dz in (-1, 1):
-                    for dw in (-1, 1):
-                        if dx == dy == dz == dw == 0:
-                            continue
-                        directions.append((dx, dy, dz, dw))
-        super().__init__(player, SlidingMovement(directions))
+        super().__init__(player, SlidingMovement(_BISHOP_DIRS))
 
 
 class Queen(Piece):
     name = "Queen"
     short_name = "Q"
 
+    __slots__ = ()
+
     def __init__(self, player: "Player") -> None:
-        directions: List[Coordinate] = []
-        basis_vectors: List[Coordinate] = []
-        for axis in range(4):
-            for sign in (-1, 1):
-                step = [0, 0, 0, 0]
-                step[axis] = sign
-                basis_vectors.append(tuple(step))
-        for dx in (-1, 0, 1):
-            for dy in (-1, 0, 1):
-                for dz in (-1, 0, 1):
-                    for dw in (-1, 0, 1):
-                        if dx == dy == dz == dw == 0:
-                            continue
-                        if abs(dx) + abs(dy) + abs(dz) + abs(dw) == 1:
-                            continue  # already covered by rook directions
-                        directions.append((dx, dy, dz, dw))
-        directions.extend(basis_vectors)
-        super().__init__(player, SlidingMovement(directions))
+        super().__init__(player, SlidingMovement(_QUEEN_DIRS))
 
 
 class Knight(Piece):
     name = "Knight"
     short_name = "N"
 
+    __slots__ = ()
+
     def __init__(self, player: "Player") -> None:
-        offsets: List[Coordinate] = []
-        axes = range(4)
-        for long_axis in axes:
-            for short_axis in axes:
-                if short_axis == long_axis:
-                    continue
-                for long_step in (-2, 2):
-                    for short_step in (-1, 1):
-                        vector = [0, 0, 0, 0]
-                        vector[long_axis] = long_step
-                        vector[short_axis] = short_step
-                        offsets.append(tuple(vector))
-        super().__init__(player, KnightMovement(offsets))
+        super().__init__(player, KnightMovement(_KNIGHT_OFFSETS))
 
 
 class King(Piece):
     name = "King"
     short_name = "K"
 
+    __slots__ = ()
+
     def __init__(self, player: "Player") -> None:
-        super().__init__(player, KingMovement())
+        super().__init__(player, KnightMovement(_KING_DIRS))
 
 
 class Pawn(Piece):
     name = "Pawn"
     short_name = "P"
 
+    __slots__ = ()
+
     def __init__(self, player: "Player") -> None:
         super().__init__(player, PawnMovement(player.forward_axis, player.forward_direction))
 
@@ -292,6 +471,8 @@ class Cat(Piece):
     name = "Cat"
     short_name = "C"
 
+    __slots__ = ()
+
     def __init__(self, player: "Player") -> None:
         super().__init__(player, CatMovement())
 
@@ -305,6 +486,8 @@ class Alien(Piece):
     name = "Alien"
     short_name = "A"
 
+    __slots__ = ()
+
     def __init__(self, player: "Player") -> None:
-        super().__init__(player, KingMovement())
+        super().__init__(player, KnightMovement(_KING_DIRS))
 
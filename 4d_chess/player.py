@@ -1,13 +1,18 @@
 """Player model for 4D chess."""
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import List
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class Player:
-    """Represents one participant in the four-dimensional chess match."""
+    """Represents one participant in the four-dimensional chess match.
+
+    Instances are canonical: every piece of a player shares the same object,
+    so ownership tests compare identity rather than five fields.
+    """
 
     index: int
     identifier: str
@@ -15,9 +20,22 @@ class Player:
     forward_axis: int
     forward_direction: int
 
+    def __post_init__(self) -> None:
+        # Interned identifiers make the frequent string compares in game
+        # reporting and dispatch pointer comparisons.
+        object.__setattr__(self, "identifier", sys.intern(self.identifier))
+        object.__setattr__(self, "color", sys.intern(self.color))
+
     def owns(self, piece: "Piece") -> bool:
         return piece.player is self
 
+    @property
+    def occupant_code(self) -> int:
+        """Signed id used in Board4D's flat occupancy array (0 means empty)."""
+
+        magnitude = self.index + 1
+        return magnitude if self.index % 2 == 0 else -magnitude
+
     @property
     def home_rank(self) -> int:
         return 0 if self.forward_direction > 0 else -1
@@ -26,15 +44,20 @@ class Player:
         return self.identifier
 
 
+# Canonical player singletons: every caller shares these instances, which
+# is what makes the identity-based ownership checks reliable.
+_DEFAULT_PLAYERS: tuple = (
+    Player(index=0, identifier="Alpha", color="White", forward_axis=0, forward_direction=1),
+    Player(index=1, identifier="Beta", color="Black", forward_axis=0, forward_direction=-1),
+    Player(index=2, identifier="Gamma", color="Gold", forward_axis=1, forward_direction=1),
+    Player(index=3, identifier="Delta", color="Azure", forward_axis=1, forward_direction=-1),
+)
+
+
 def default_players() -> List[Player]:
     """Return the default set of up to four players."""
 
-    return [
-        Player(index=0, identifier="Alpha", color="White", forward_axis=0, forward_direction=1),
-        Player(index=1, identifier="Beta", color="Black", forward_axis=0, forward_direction=-1),
-        Player(index=2, identifier="Gamma", color="Gold", forward_axis=1, forward_direction=1),
-        Player(index=3, identifier="Delta", color="Azure", forward_axis=1, forward_direction=-1),
-    ]
+    return list(_DEFAULT_PLAYERS)
 
 
 from typing import TYPE_CHECKING
@@ -57,6 +57,75 @@ def test_reshape_axis(players) -> None:
     assert rook.position == (6, 0, 0, 0)
 
 
+def test_transformation_mapper_may_overshoot_far_out_of_bounds(players) -> None:
+    board = Board4D((4, 4, 4, 4))
+    alien = Alien(players[0])
+    pawn = Pawn(players[1])
+    board.place_piece(alien, (0, 0, 0, 0))
+    board.place_piece(pawn, (1, 1, 1, 1))
+
+    def mapper(position):
+        x, y, z, w = position
+        return (x + 200, y, z, w)
+
+    result = board.apply_transformation(mapper, alien)
+    assert pawn in result.casualties
+    assert not pawn.is_active
+    assert alien.position == (0, 0, 0, 0)
+
+
+def test_transpose_parks_preserved_alien_off_grid(players) -> None:
+    board = Board4D((2, 8, 2, 2))
+    alien = Alien(players[0])
+    rook = Rook(players[1])
+    board.place_piece(alien, (1, 7, 1, 1))
+    board.place_piece(rook, (0, 3, 0, 0))
+    board.swap_axes(0, 1, alien)
+    assert board.dimensions == (8, 2, 2, 2)
+    assert rook.position == (3, 0, 0, 0)
+    # The alien's old coordinate does not exist under the new dimensions:
+    # it survives off-grid, addressable there, instead of landing in an
+    # unrelated cell.
+    assert alien.is_active
+    assert alien.position == (1, 7, 1, 1)
+    assert board.get_piece((1, 7, 1, 1)) is alien
+    assert board.get_piece((4, 1, 1, 1)) is None
+    # Six files beyond the edge, so no single step re-enters the board.
+    assert alien.legal_moves(board) == ()
+
+
+def test_off_grid_piece_can_reenter(players) -> None:
+    board = Board4D((8, 8, 8, 7))
+    alien = Alien(players[0])
+    rook = Rook(players[1])
+    board.place_piece(alien, (7, 0, 0, 3))
+    board.place_piece(rook, (1, 2, 3, 4))
+    board.swap_axes(0, 3, alien)
+    assert board.dimensions == (7, 8, 8, 8)
+    assert rook.position == (4, 2, 3, 1)
+    # One step off the shortened axis: every re-entry move steps back in.
+    assert board.get_piece((7, 0, 0, 3)) is alien
+    moves = alien.legal_moves(board)
+    assert len(moves) == 12
+    assert all(board.is_within_bounds(move) for move in moves)
+    board.move_piece((7, 0, 0, 3), (6, 0, 0, 3))
+    assert board.get_piece((6, 0, 0, 3)) is alien
+    assert board.get_piece((7, 0, 0, 3)) is None
+
+
+def test_leap_tables_survive_shape_preserving_transformations(players) -> None:
+    board = Board4D((4, 4, 4, 4))
+    alien = Alien(players[0])
+    board.place_piece(alien, (0, 0, 0, 0))
+    offsets = alien._movement.offsets
+    table = board._leap_table(offsets)
+    # A transpose of a cubic board keeps the dimensions, so the cached
+    # destination tables must survive instead of being rebuilt.
+    board.transpose((1, 0, 2, 3), alien)
+    assert board._leap_table(offsets) is table
+    assert board._cat_slip_table() is board._cat_slip_table()
+
+
 def test_transformation_collision_eliminates(players) -> None:
     board = Board4D((4, 4, 4, 4))
     alien = Alien(players[0])
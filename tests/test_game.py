@@ -57,6 +57,72 @@ def test_alien_swapaxis_advances_turn() -> None:
     assert game.current_player is players[1]
 
 
+def test_scratch_bypasses_stale_cached_moves() -> None:
+    game = prepare_custom_game()
+    players = game.players
+    cat = Cat(players[0])
+    victim = Rook(players[1])
+    alien = Alien(players[1])
+    game.board.place_piece(cat, (2, 0, 0, 0))
+    game.board.place_piece(victim, (3, 0, 0, 0))
+    game.board.place_piece(alien, (0, 4, 4, 4))
+    game._player_pieces[players[0]].append(cat)
+    game._player_pieces[players[1]].extend([victim, alien])
+
+    rook_moves = game.legal_moves_from((3, 0, 0, 0))
+    assert rook_moves
+
+    # Scratch, identity transpose, scratch back: the board occupancy (and
+    # with it the Zobrist hash) returns to the starting position, but the
+    # victim now moves as a pawn and must not be served the rook entry.
+    game.move((2, 0, 0, 0), (3, 0, 0, 0))
+    game.perform_alien_operation(players[1], "transpose", 0, 1, 2, 3)
+    game.move((3, 0, 0, 0), (2, 0, 0, 0))
+
+    assert victim.position == (3, 0, 0, 0)
+    assert game.legal_moves_from((3, 0, 0, 0)) == []
+
+
+def test_alien_op_invalidates_cached_moves() -> None:
+    game = prepare_custom_game()
+    players = game.players
+    alien = Alien(players[0])
+    ally = Rook(players[0])
+    game.board.place_piece(alien, (0, 2, 0, 0))
+    game.board.place_piece(ally, (1, 0, 0, 0))
+    game._player_pieces[players[0]].extend([alien, ally])
+
+    assert game.legal_moves_from((1, 0, 0, 0))
+    game.perform_alien_operation(players[0], "swapaxis", 0, 1)
+
+    assert game.legal_moves_from((1, 0, 0, 0)) == []
+    assert game.legal_moves_from((0, 1, 0, 0)) == sorted(ally.legal_moves(game.board))
+
+
+def test_pieces_for_player_tracks_board_level_removal() -> None:
+    game = FourDChessGame(player_count=2)
+    player = game.players[0]
+    before = game.pieces_for_player(player)
+    victim = before[0]
+    game.board.remove_piece(victim.position)
+    remaining = game.pieces_for_player(player)
+    assert victim not in remaining
+    assert len(remaining) == len(before) - 1
+
+
+def test_alien_swapaxis_on_non_cubic_board() -> None:
+    game = FourDChessGame(player_count=2, dimensions=(8, 8, 8, 4))
+    game.move((1, 0, 0, 0), (2, 0, 0, 0))
+    # The second player's pieces sit at rank 7, which does not exist on the
+    # shortened axis after the swap; the operation must not corrupt the
+    # board even though the performing alien itself goes off-grid.
+    game.perform_alien_operation(game.players[1], "swapaxis", 0, 3)
+    assert game.board.dimensions == (4, 8, 8, 8)
+    for position, piece in game.board.pieces():
+        if game.board.is_within_bounds(position):
+            assert game.board.get_piece(position) is piece
+
+
 def test_winner_detected_after_king_removed() -> None:
     game = prepare_custom_game()
     players = game.players